@@ -1,4 +1,3 @@
-import logging
 from prompt_toolkit.enums import EditingMode
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.filters import (
@@ -11,46 +10,38 @@ from prompt_toolkit.filters import (
 
 from .pgbuffer import buffer_should_be_handled, safe_multi_line_mode
 
-_logger = logging.getLogger(__name__)
+_TAB_INSERT = " " * 4
 
 
 def pgcli_bindings(pgcli):
     """Custom key bindings for pgcli."""
     kb = KeyBindings()
 
-    tab_insert_text = " " * 4
-
     @kb.add("f2")
     def _(event):
         """Enable/Disable SmartCompletion Mode."""
-        _logger.debug("Detected F2 key.")
-        pgcli.completer.smart_completion = not pgcli.completer.smart_completion
+        completer = pgcli.completer
+        completer.smart_completion = not completer.smart_completion
 
     @kb.add("f3")
     def _(event):
         """Enable/Disable Multiline Mode."""
-        _logger.debug("Detected F3 key.")
         pgcli.multi_line = not pgcli.multi_line
 
     @kb.add("f4")
     def _(event):
         """Toggle between Vi and Emacs mode."""
-        _logger.debug("Detected F4 key.")
         pgcli.vi_mode = not pgcli.vi_mode
         event.app.editing_mode = EditingMode.VI if pgcli.vi_mode else EditingMode.EMACS
 
     @kb.add("f5")
     def _(event):
         """Toggle between Vi and Emacs mode."""
-        _logger.debug("Detected F5 key.")
         pgcli.explain_mode = not pgcli.explain_mode
 
     @kb.add("tab")
     def _(event):
         """Force autocompletion at cursor on non-empty lines."""
-
-        _logger.debug("Detected <Tab> key.")
-
         buff = event.app.current_buffer
         doc = buff.document
 
@@ -60,15 +51,12 @@ def pgcli_bindings(pgcli):
             else:
                 buff.start_completion(select_first=True)
         else:
-            buff.insert_text(tab_insert_text, fire_event=False)
+            buff.insert_text(_TAB_INSERT, fire_event=False)
 
     @kb.add("escape", filter=has_completions)
     def _(event):
         """Force closing of autocompletion."""
-        _logger.debug("Detected <Esc> key.")
-
         event.current_buffer.complete_state = None
-        event.app.current_buffer.complete_state = None
 
     @kb.add("c-space")
     def _(event):
@@ -80,8 +68,6 @@ def pgcli_bindings(pgcli):
 
         If the menu is showing, select the next completion.
         """
-        _logger.debug("Detected <C-Space> key.")
-
         b = event.app.current_buffer
         if b.complete_state:
             b.complete_next()
@@ -97,10 +83,7 @@ def pgcli_bindings(pgcli):
         (accept current selection).
 
         """
-        _logger.debug("Detected enter key during completion selection.")
-
         event.current_buffer.complete_state = None
-        event.app.current_buffer.complete_state = None
 
     # When using multi_line input mode the buffer is not handled on Enter (a new line is
     # inserted instead), so we force the handling if we're not in a completion or
@@ -110,13 +93,11 @@ def pgcli_bindings(pgcli):
         filter=~(completion_is_selected | is_searching) & buffer_should_be_handled(pgcli),
     )
     def _(event):
-        _logger.debug("Detected enter key.")
         event.current_buffer.validate_and_handle()
 
     @kb.add("escape", "enter", filter=~vi_mode & ~safe_multi_line_mode(pgcli))
     def _(event):
         """Introduces a line break regardless of multi-line mode or not."""
-        _logger.debug("Detected alt-enter key.")
         event.app.current_buffer.insert_text("\n")
 
     @kb.add("c-p", filter=~has_selection)